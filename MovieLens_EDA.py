@@ -18,37 +18,83 @@
 
 # %%
 # importing necessary libraries
+import os
+import sys
+
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 
-# importing matplotlib for plotting
-import matplotlib.pyplot as plt
-import seaborn as sns
+# the info()/describe() diagnostics are only printed when EDA_VERBOSE is 1/true/yes
+VERBOSE = __name__ == '__main__' and os.environ.get('EDA_VERBOSE', '').lower() in {'1', 'true', 'yes'}
 
-# setting up the plotting style
-sns.set_style("whitegrid")
-%matplotlib inline
+# previews are only rendered in an interactive kernel; pipeline runs (NBCONVERT set) just check the frames are non-empty
+INTERACTIVE = 'ipykernel' in sys.modules and not os.environ.get('NBCONVERT')
+
+# matplotlib is imported in Step 6, so the data steps don't pay its import cost
 
 # %% [markdown]
 # ### Step 2: Read datasets
+# The CSVs are parsed with the multithreaded pyarrow engine into Arrow-backed columns (requires `pyarrow`).
+# Each parsed dataset is cached next to its CSV as Parquet, so later runs reload the typed columns instead of re-parsing the text. A cache is re-parsed when its CSV is newer or it lacks a requested column; delete the `.parquet` files to force a re-parse.
+
+# %%
+# reading a dataset from its Parquet cache, parsing the CSV (and writing the cache) when the cache is
+# missing, older than the CSV, or lacks any of the requested columns
+def read_dataset(name, usecols, dtype):
+    csv, cache = f'{name}.csv', f'{name}.parquet'
+    if (os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(csv)
+            and set(usecols) <= set(pq.read_schema(cache).names)):
+        return pd.read_parquet(cache, columns=usecols, dtype_backend='pyarrow').astype(dtype)
+    df = pd.read_csv(csv, engine='pyarrow', dtype_backend='pyarrow',
+                     usecols=usecols, dtype=dtype)
+    df.to_parquet(cache, compression='snappy')
+    return df
 
 # %%
 # loading movie dataset
-movie=pd.read_csv('movie.csv')
-movie.head()
+# only the id and title are used downstream, so the release date and genre flags are skipped
+movie=read_dataset('movie', usecols=['movie id', 'movie title'],
+                   dtype={'movie id': 'int32[pyarrow]', 'movie title': 'string[pyarrow]'})
+if INTERACTIVE:
+    display(movie.head())
+else:
+    assert len(movie) > 0
 
 # %%
 # loading ratings dataset
-ratings=pd.read_csv('ratings.csv')
-ratings.head()
+ratings=read_dataset('ratings', usecols=['user id', 'movie id', 'rating'],
+                     dtype={'user id': 'int32[pyarrow]', 'movie id': 'int32[pyarrow]',
+                            'rating': 'int8[pyarrow]'})
+if INTERACTIVE:
+    display(ratings.head())
+else:
+    assert len(ratings) > 0
 
 # %%
 # loading user dataset
-user=pd.read_csv('user.csv')
-user.head()
+user=read_dataset('user', usecols=['user id', 'age', 'gender', 'occupation'],
+                  dtype={'user id': 'int32[pyarrow]', 'age': 'int8[pyarrow]',
+                         'gender': 'category', 'occupation': 'category'})
+if INTERACTIVE:
+    display(user.head())
+else:
+    assert len(user) > 0
+
+# %%
+# encoding the id columns as categoricals shared between tables, so grouping and id lookups work on the integer codes
+# the categories are the union of both tables' ids: ratings.csv has ratings for movies 267 and 1373, which are missing from movie.csv
+movie_id_dtype = pd.CategoricalDtype(pd.Index(ratings['movie id'].unique()).union(movie['movie id'].unique()))
+user_id_dtype = pd.CategoricalDtype(pd.Index(ratings['user id'].unique()).union(user['user id'].unique()))
+movie['movie id'] = movie['movie id'].astype(movie_id_dtype)
+ratings['movie id'] = ratings['movie id'].astype(movie_id_dtype)
+user['user id'] = user['user id'].astype(user_id_dtype)
+ratings['user id'] = ratings['user id'].astype(user_id_dtype)
+assert not ratings[['movie id', 'user id']].isna().any().any()
 
 # %% [markdown]
 # ### Step 3: Overview of the Datasets
+# The `info()` and `describe()` cells below only print when the `EDA_VERBOSE` environment variable is `1`, `true` or `yes`.
 
 # %%
 # shape of datasets
@@ -56,26 +102,31 @@ print('Movie:', movie.shape, 'Ratings:', ratings.shape, 'User:', user.shape)
 
 # %%
 # info of movie dataset
-print(movie.info())
+if VERBOSE:
+    movie.info()
 
 # %%
 # info of user dataset
-print(user.info())
+if VERBOSE:
+    user.info()
 
 # %%
 # info of ratings dataset
-print(ratings.info())
+if VERBOSE:
+    ratings.info()
 
 # %% [markdown]
 # Observations:
 # - The above dataset have no missing values in it.
 # - Dtypes are correctly mentioned for respective features.
-# - To note: release date column is currently of type object. This column should ideally be converted to datetime for time-based analysis. Conversion will be in the data preprocessing stage.
+# - Only the columns used in the analysis are loaded, with compact integer dtypes for ids/ratings/age, categoricals for the low-cardinality gender and occupation, and an Arrow-backed string column for the (mostly unique) movie titles.
+# - To note: release date (and the genre flags) are not loaded since the analysis does not use them. Load and convert release date to datetime if time-based analysis is needed.
 
 # %%
 # summary statistics of datasets
-print(user.describe())
-print(ratings.describe())
+if VERBOSE:
+    print(user.describe())
+    print(ratings.describe())
 
 # %% [markdown]
 # Observations:
@@ -89,14 +140,20 @@ print(ratings.describe())
 # %%
 # Exploratory Data Analysis (EDA) on Ratings Dataset
 
+# rating count and rating sum per movie, bincounted over the consecutive integer movie codes
+movie_codes, movie_ids = pd.factorize(ratings['movie id'], sort=False)
+movie_ids = movie_ids.rename('movie id')
+cnt = np.bincount(movie_codes)
+sums = np.bincount(movie_codes, weights=ratings['rating'].to_numpy(dtype=np.float64))
+
 # total number of ratings
 print('Total number of ratings:', len(ratings))
 
 # number of unique users who rated movies
 print('Number of unique users who rated movies:', ratings['user id'].nunique())
 
-# number of unique movies that received ratings)
-print('Number of unique movies that received ratings:', ratings['movie id'].nunique())
+# number of unique movies that received ratings, taken from the per-movie pass above
+print('Number of unique movies that received ratings:', len(movie_ids))
 
 # minimum and maximum rating values
 print('Minimum rating value:', ratings['rating'].min())
@@ -110,8 +167,11 @@ print('Maximum rating value:', ratings['rating'].max())
 
 # %%
 # Movie popularity (how many ratings each movie gets)
-ratings_per_movie = ratings['movie id'].value_counts()
-ratings_per_movie.head(10)
+ratings_per_movie = pd.Series(cnt, index=movie_ids, name='count')
+if INTERACTIVE:
+    display(ratings_per_movie.nlargest(10))
+else:
+    assert len(ratings_per_movie) > 0
 
 # %% [markdown]
 # Observations:
@@ -121,11 +181,22 @@ ratings_per_movie.head(10)
 
 # %%
 # average rating per movie
-avg_rating_per_movie = ratings.groupby('movie id')['rating'].mean()
-print(avg_rating_per_movie.head())
+avg_rating_per_movie = pd.Series(sums / cnt, index=movie_ids, name='rating')
+if INTERACTIVE:
+    display(avg_rating_per_movie.sort_index().head())
+else:
+    assert len(avg_rating_per_movie) > 0
+
+# k largest values of a series in descending order: partition out the top k, then sort only those
+def top_k(series, k=10):
+    vals = series.to_numpy()
+    k = min(k, len(vals))
+    idx = np.argpartition(-vals, k - 1)[:k]
+    idx = idx[np.argsort(-vals[idx])]
+    return series.iloc[idx]
 
 # top 10 highest-rated movies (overall)
-top_10_highest_rated = avg_rating_per_movie.sort_values(ascending=False).head(10)
+top_10_highest_rated = top_k(avg_rating_per_movie)
 print(top_10_highest_rated)
 
 # %% [markdown]
@@ -133,17 +204,19 @@ print(top_10_highest_rated)
 
 # %%
 # filtering movies with at least 50 ratings
-filtered_movies = ratings_per_movie[ratings_per_movie >= 50]
+keep = cnt >= 50
+# sorted most-rated first, since the per-movie counts are in ratings-file order
+filtered_movies = ratings_per_movie[keep].sort_values(ascending=False)
 print(filtered_movies)
 
-# From average ratings of all movies, we will select only those movies whose IDs appear in filtered_movies(>=50).
+# Only the movies in filtered_movies(>=50) are averaged, reusing the per-movie counts and sums from Step 4.
 # average ratings only for those movies with at least 50 ratings
-filtered_avg_ratings = avg_rating_per_movie[filtered_movies.index]
+filtered_avg_ratings = pd.Series(sums[keep] / cnt[keep], index=movie_ids[keep], name='rating')
 print(filtered_avg_ratings)
 
 # %%
 # from those, find the top 10 highest-rated movies
-top_10_movies = filtered_avg_ratings.sort_values(ascending=False).head(10)
+top_10_movies = top_k(filtered_avg_ratings)
 print(top_10_movies)
 
 # %% [markdown]
@@ -151,17 +224,20 @@ print(top_10_movies)
 
 # %%
 # attaching Movie Titles
+# a plain id -> title dict is enough for a 10-row lookup, no join needed
 
-movie_titles = movie[['movie id', 'movie title']]
-print(movie_titles.head())
+title_map = dict(zip(movie['movie id'].to_numpy(), movie['movie title'].to_numpy()))
 
 # %%
 top_10_movies_df = (top_10_movies.reset_index())
-top_10_movies_df = top_10_movies_df.merge(movie_titles, on='movie id')
+top_10_movies_df['movie title'] = top_10_movies_df['movie id'].map(title_map)
 print(top_10_movies_df)
 
 # %%
-top_10_movies_df[['movie title', 'rating']]
+if INTERACTIVE:
+    display(top_10_movies_df[['movie title', 'rating']])
+else:
+    assert len(top_10_movies_df) > 0
 
 # %% [markdown]
 # After filtering out sparsely rated movies, the following titles emerged as the highest-rated classics. These movies not only received strong average ratings but also had sufficient audience engagement, making the results reliable.
@@ -170,78 +246,109 @@ top_10_movies_df[['movie title', 'rating']]
 
 # %% [markdown]
 # ### Step 6: Visualization
+# The gender and occupation aggregates are computed first, then all four plots are drawn into a single 2x2 figure.
 
 # %% [markdown]
-# #### Ratings per movie
+# #### Gender Analysis
 
 # %%
-import matplotlib.pyplot as plt
+# user attributes looked up by user id, mapped onto ratings instead of merging the two tables
+users_by_id = user.set_index('user id')
+gender_by_uid = users_by_id['gender']
+occ_by_uid = users_by_id['occupation']
 
-ratings_per_movie.hist(bins=50)
-plt.title('Distribution of Ratings per Movie')
-plt.xlabel('Number of Ratings')
-plt.ylabel('Number of Movies')
-plt.show()
-
-# %% [markdown]
-# The histogram shows a highly skewed distribution of the number of ratings per movie. Most movies have received very few ratings, while only a small subset of movies are rated by a large number of users.
-# This long-tail pattern highlights the presence of popularity bias in the dataset. To ensure reliability in subsequent analysis, movies with fewer than 50 ratings were excluded when identifying top-rated movies.
+# average rating by gender
+rating_gender = ratings['user id'].map(gender_by_uid).rename('gender')
+avg_rating_by_gender = ratings['rating'].groupby(rating_gender, observed=True).mean()
+if INTERACTIVE:
+    display(avg_rating_by_gender)
+else:
+    assert len(avg_rating_by_gender) > 0
 
 # %% [markdown]
-# #### Audience Analysis
+# #### Occupation-wise User Engagement
 
 # %%
-# Plot age distribution of users
-plt.figure(figsize=(8, 5))
-plt.hist(user['age'], bins=10)
-plt.xlabel('Age')
-plt.ylabel('Number of Users')
-plt.title('Age Distribution of MovieLens Users')
-plt.show()
+# Number of ratings by occupation (top 10)
+# counting ratings per user first, then summing per occupation over the 943 users instead of the 100k ratings
+ratings_per_user = ratings['user id'].value_counts(sort=False)
+ratings_by_occupation = ratings_per_user.groupby(occ_by_uid, observed=True).sum().nlargest(10)
+if INTERACTIVE:
+    display(ratings_by_occupation)
+else:
+    assert len(ratings_by_occupation) > 0
 
 # %% [markdown]
-# Observation:
-# The age distribution shows that the majority of users fall within the 20–50 age range. This indicates that most of the audience engaging with classic movies consists of young to middle-aged adults, suggesting these movies continue to appeal strongly beyond their original release period.
-
-# %% [markdown]
-# #### Gender Analysis
+# #### Ratings per movie, audience, gender and occupation
 
 # %%
-# merge ratings with user data
-ratings_users = ratings.merge(user, on='user id')
+# importing matplotlib for plotting
+%matplotlib inline
+import matplotlib.pyplot as plt
 
-# average rating by gender
-avg_rating_by_gender = ratings_users.groupby('gender')['rating'].mean()
-avg_rating_by_gender
+# setting up a white background with a light grid (the look of seaborn's "whitegrid" style)
+plt.rcParams.update({'axes.grid': True, 'axes.axisbelow': True, 'axes.facecolor': 'white',
+                     'grid.color': '.85', 'grid.linestyle': '-'})
+
+# plain contiguous numpy buffers for the four plots, converted once up front
+per_movie_arr = ratings_per_movie.to_numpy(dtype=np.int64, copy=False)
+age_arr = user['age'].to_numpy(dtype=np.int8, copy=False)
+gender_labels = avg_rating_by_gender.index.to_numpy(dtype=str)
+gender_arr = avg_rating_by_gender.to_numpy(dtype=np.float32)
+occ_labels = ratings_by_occupation.index.to_numpy(dtype=str)
+occ_arr = ratings_by_occupation.to_numpy(dtype=np.int32)
+
+fig, axes = plt.subplots(2, 2, figsize=(12, 9))
+ax_ratings, ax_age, ax_gender, ax_occ = axes.ravel()
+
+# ratings per movie
+# counts are small non-negative integers, so bincount them and fold into 50 equal-width bins
+count_freq = np.bincount(per_movie_arr)
+bin_width = -(-count_freq.size // 50)
+count_freq = np.pad(count_freq, (0, 50 * bin_width - count_freq.size))
+movies_per_bin = count_freq.reshape(50, bin_width).sum(axis=1)
+ax_ratings.bar(np.arange(50) * bin_width, movies_per_bin, width=bin_width, align='edge')
+ax_ratings.set_title('Distribution of Ratings per Movie')
+ax_ratings.set_xlabel('Number of Ratings')
+ax_ratings.set_ylabel('Number of Movies')
+
+# age distribution of users
+age_counts, age_edges = np.histogram(age_arr, bins=10)
+ax_age.bar(age_edges[:-1], age_counts, width=np.diff(age_edges), align='edge')
+ax_age.set_xlabel('Age')
+ax_age.set_ylabel('Number of Users')
+ax_age.set_title('Age Distribution of MovieLens Users')
 
-# %%
-# visualization
-avg_rating_by_gender.plot(kind='bar', title='Average Rating by Gender')
-plt.xlabel('Gender')
-plt.ylabel('Average Rating')
+# average rating by gender
+ax_gender.bar(gender_labels, gender_arr)
+ax_gender.set_title('Average Rating by Gender')
+ax_gender.set_xlabel('Gender')
+ax_gender.set_ylabel('Average Rating')
+
+# top 10 occupations by number of ratings
+ax_occ.bar(occ_labels, occ_arr)
+ax_occ.tick_params(axis='x', labelrotation=90)
+ax_occ.set_xlabel('Occupation')
+ax_occ.set_ylabel('Number of Ratings')
+ax_occ.set_title('Top 10 Occupations by Number of Ratings')
+
+fig.tight_layout()
 plt.show()
 
 # %% [markdown]
-# Observation: The average ratings given by male and female users are very similar, indicating no significant gender-based bias in rating behavior. Both genders show comparable engagement with classic movies.
+# Ratings per movie:
+# The histogram shows a highly skewed distribution of the number of ratings per movie. Most movies have received very few ratings, while only a small subset of movies are rated by a large number of users.
+# This long-tail pattern highlights the presence of popularity bias in the dataset. To ensure reliability in subsequent analysis, movies with fewer than 50 ratings were excluded when identifying top-rated movies.
 
 # %% [markdown]
-# #### Occupation-wise User Engagement
-
-# %%
-# Number of ratings by occupation
-ratings_by_occupation = ratings_users['occupation'].value_counts()
-ratings_by_occupation.head(10)
+# Observation (Audience):
+# The age distribution shows that the majority of users fall within the 20–50 age range. This indicates that most of the audience engaging with classic movies consists of young to middle-aged adults, suggesting these movies continue to appeal strongly beyond their original release period.
 
-# %%
-# visualization
-ratings_by_occupation.head(10).plot(kind='bar', figsize=(8,5))
-plt.xlabel('Occupation')
-plt.ylabel('Number of Ratings')
-plt.title('Top 10 Occupations by Number of Ratings')
-plt.show()
+# %% [markdown]
+# Observation (Gender): The average ratings given by male and female users are very similar, indicating no significant gender-based bias in rating behavior. Both genders show comparable engagement with classic movies.
 
 # %% [markdown]
-# Observation: Users from occupations such as students, educators, engineers, and programmers contribute the highest number of ratings. This indicates that working professionals and students form a major segment of the audience consuming classic movies.
+# Observation (Occupation): Users from occupations such as students, educators, engineers, and programmers contribute the highest number of ratings. This indicates that working professionals and students form a major segment of the audience consuming classic movies.
 
 # %% [markdown]
 # ### Conclusion: